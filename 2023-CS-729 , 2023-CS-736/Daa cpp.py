@@ -1,102 +1,259 @@
+import importlib.machinery
+import importlib.util
 import math
+import os
 import re
+import types
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only solve_many needs it
+    np = None
+
+# _core.py (or its mypyc build, which the finder prefers) lives next to this file. It is loaded
+# from there by path, so the script works from any working directory and sys.path is left alone
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_core_spec = importlib.machinery.PathFinder.find_spec("_core", [_HERE])
+if _core_spec is None:
+    raise ImportError(f"_core not found next to {__file__}")
+_core = importlib.util.module_from_spec(_core_spec)
+_core_spec.loader.exec_module(_core)
+critical_exponent = _core.critical_exponent
+classify = _core.classify
+approximation_exponent = _core.approximation_exponent
+substitution_base = _core.substitution_base
+
+_KERNEL_NAMES = ("critical_exponent", "classify", "approximation_exponent", "substitution_base")
+_JIT_KERNELS = {}
+
+
+def jit_kernels():
+    # The _core kernels JIT-compiled with numba, by name, for batch callers that loop over many
+    # inputs. numba is imported and the kernels compiled on the first call only; the relation
+    # classes keep the plain _core functions, which are cheaper per call than a JIT dispatch.
+    # Without numba, or with a mypyc-built _core, these are the _core functions themselves
+    if not _JIT_KERNELS:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional
+            njit = None
+        if njit is None or not _core.__file__.endswith(".py"):
+            _JIT_KERNELS.update((name, getattr(_core, name)) for name in _KERNEL_NAMES)
+        else:
+            # JIT copies sharing a private globals dict in which each kernel name refers to its
+            # JIT version, so classify calls the compiled critical_exponent; _core is left as is.
+            # No on-disk cache: numba reloads a cached kernel by importing _core by name, and _core
+            # is not importable by name since it is loaded by path
+            namespace = dict(vars(_core))
+            for name in _KERNEL_NAMES:
+                func = getattr(_core, name)
+                namespace[name] = njit(types.FunctionType(func.__code__, namespace, name))
+            _JIT_KERNELS.update((name, namespace[name]) for name in _KERNEL_NAMES)
+    return _JIT_KERNELS
+
+# Numeric literals; every capture passed to float() below is built from one, so float() never fails
+_NUM = r'-?\d+(?:\.\d+)?'
+_DIVISOR = r'\d+(?:\.\d+)?'  # b in T(n/b) / T(n-b) is never negative
+
+# Classification patterns for f(n), tried in order by determine_function_type
+_CONST_RE = re.compile(r'^(?:\d+|[c01])$')
+# Iterated logarithm: loglog(n), log log n, log(log(n))
+_LOGLOG_RE = re.compile(r'^log\s*\(?log\s*\(?n\)?\)?$')
+# Pure logarithm of n: log(n), log^p(n), log(n)^p, logn
+_LOGP_RE = re.compile(r'^log(?:\^(' + _NUM + r'))?\s*\(?n\)?(?:\^(' + _NUM + r'))?$')
+_POLY_RE = re.compile(r'^n(?:\^(' + _NUM + r'))?$')
+_EXP_RE = re.compile(r'^(\d+(?:\.\d+)?|e)\^n$')
+# Fallbacks for the remaining forms, following the rules the solver has always used
+_LOG_POW_RE = re.compile(r'log[^^]*\^(' + _NUM + r')(?:\(|$)')  # p of the first log^p( in n*log^p(n)
+_POW_RE = re.compile(r'^[^^]*\^(' + _NUM + r')$')  # Trailing exponent of any other n^k form
+_BASE_RE = re.compile(r'^(' + _NUM + r')\^')  # Numeric base of any other k^(...) form
+
+_WS_RE = re.compile(r'\s+')
+
+# Whole recurrence in one pass: either aT(n/b) or aT(n-b), or T(n/b) + T(n/b') with no
+# coefficients, then f(n). Nothing after the recursive terms may be another T(...) term
+# (a t( not preceded by a letter, so sqrt(n) is still allowed)
+_EQ_RE = re.compile(
+    r't\(n\)=(?:(\d+)?t\(n(?:/(' + _DIVISOR + r')|-(' + _DIVISOR + r'))\)'
+    r'|t\(n/(' + _DIVISOR + r')\)\+t\(n/(' + _DIVISOR + r')\))'
+    r'\+(?!.*(?<![a-z])t\()([^+]+)'
+)
+
+# Formatted solutions shared by all relations, keyed by (class, constructor arguments, notation)
+_SOLUTIONS = {}
+_SOLUTIONS_MAX = 4096
+
+# Relations built by RecurrenceSolver.create_relation, keyed by (type, a, b, fn, diff_sizes, b_prime).
+# Relations are immutable, so one instance can be handed to every caller with the same input
+_RELATIONS = {}
+_RELATIONS_MAX = 1024
+
+# Stands in for the notation when compile_solver() renders a solution template
+_NOTATION_SLOT = "\x00"
+
+# Solution formatters, bound once; called as fmt(notation, bound exponent, log exponent)
+_FMT_POWER = "{0}(n^{1:.2f})".format
+_FMT_POWER_LOG = "{0}(n^{1:.2f} * log^{2:.2f}n)".format
+_FMT_POWER_LOGLOG = "{0}(n^{1:.2f} * log log n)".format
+
+# Menu choice in get_input -> notation
+_NOTATION_CHOICES = {'1': "O", '2': "Ω", '3': "Θ"}
+
+# Master Theorem cases indexed by the case id returned by classify(): (method name, formatter)
+_MASTER_CASES = (
+    ("Master Theorem (Case 1)", _FMT_POWER),
+    ("Master Theorem (Case 2a)", _FMT_POWER_LOG),
+    ("Master Theorem (Case 2b)", _FMT_POWER_LOGLOG),
+    ("Master Theorem (Case 2c)", _FMT_POWER),
+    ("Master Theorem (Case 3a)", _FMT_POWER_LOG),
+    ("Master Theorem (Case 3b)", _FMT_POWER),
+)
+
+
+def solve_many(a, b, k, p):
+    # Vectorised classify() over arrays of a, b, k and p.
+    # Returns arrays (case id, bound exponent, log exponent) matching classify() element-wise;
+    # rows where classify() would raise (log_b(a) undefined) get case -1 and nan exponents instead
+    # There is no fn_type argument: exponential f(n) never reaches classify() (see _solve), so
+    # it has no case id here either
+    if np is None:
+        raise ImportError("solve_many requires numpy")
+    a, b, k, p = (np.asarray(x, dtype=np.float64) for x in (a, b, k, p))
+    
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        valid = (a > 0) & (b > 0) & (b != 1)
+        log_a_b = np.select(
+            [~valid, b == 2, b == 10, b == math.e],
+            [np.nan, np.log2(a), np.log10(a), np.log(a)],
+            default=np.log(a) / np.log(b),
+        )
+        d = a - b ** k
+    
+    equal = np.abs(d) < 0.0001
+    above = ~equal & (d > 0)
+    case = np.select(
+        [~valid, equal & (p > -1), equal & (np.abs(p - (-1)) < 0.0001), equal, above, p >= 0],
+        [-1, 1, 2, 3, 0, 4],
+        default=5,
+    )
+    exponent = np.where(equal | above | ~valid, log_a_b, k)
+    log_exp = np.select([~valid, case == 1, case == 4], [np.nan, p + 1.0, p], default=0.0)
+    return case, exponent, log_exp
+
+
+def _parse_fn(fn):
+    # Reads f(n) once and returns (fn_type, log_power, exp_base, poly_exp).
+    # Patterns are tried in order; the first one that matches decides the type
+    if _CONST_RE.match(fn):
+        return 0, 1.0, 2.0, 0.0
+    
+    if _LOGLOG_RE.match(fn):
+        return 4, 1.0, 2.0, 0.0
+    
+    # Logarithmic functions (log^p(n))
+    match = _LOGP_RE.match(fn)
+    if match:
+        power = match.group(1) or match.group(2)
+        return 1, float(power) if power else 1.0, 2.0, 0.0
+    
+    # Combined polynomial and logarithmic (e.g., n*log^p(n), log(n)*n), treated as polynomial
+    if "n" in fn and "log" in fn:
+        match = _LOG_POW_RE.search(fn)
+        log_power = float(match.group(1)) if match else 1.0
+        return 2, log_power, 2.0, 1.0  # The polynomial part is usually n^1
+    
+    # Polynomial functions (n^k)
+    match = _POLY_RE.match(fn)
+    if match:
+        return 2, 1.0, 2.0, float(match.group(1)) if match.group(1) else 1.0
+    
+    # Exponential functions (k^n)
+    match = _EXP_RE.match(fn)
+    if match:
+        base = match.group(1)
+        return 3, 1.0, math.e if base == "e" else float(base), 0.0
+    
+    # Other polynomial forms (e.g., 3n^2, sqrt(n))
+    if "n^" in fn or ("n" in fn and "^" not in fn):
+        match = _POW_RE.match(fn)
+        return 2, 1.0, 2.0, float(match.group(1)) if match else 1.0
+    
+    # Other exponential forms (e.g., 2^(n/2), n*2^n)
+    if "^n" in fn or "2^" in fn or "e^" in fn:
+        if "2^" in fn:
+            exp_base = 2.0
+        elif "e^" in fn:
+            exp_base = math.e
+        else:
+            match = _BASE_RE.match(fn)
+            exp_base = float(match.group(1)) if match else 2.0
+        return 3, 1.0, exp_base, 0.0
+    
+    return 0, 1.0, 2.0, 0.0  # Default to constant if no pattern is matched
+
+
+# Parsed fields of the f(n) strings most inputs use, so these skip _parse_fn entirely
+_FN_CACHE = {fn: _parse_fn(fn) for fn in (
+    "1", "c", "n", "n^2", "n^3", "log(n)", "log^2(n)", "n*log(n)", "nlog(n)", "n^2*log(n)", "2^n",
+)}
+
 
 class RecurrenceRelation:
+    __slots__ = ('a', 'b', 'fn', 'fn_type', 'log_power', 'exp_base', '_k')
+    
     def __init__(self, a_val, b_val, fn_val):
-        self.a = a_val  # Number of subproblems
-        self.b = b_val  # Division/decrease factor
-        self.fn = fn_val  # Non-recursive part f(n)
-        self.fn_type = -1  # Type of function (0: constant, 1: logarithmic, 2: polynomial, 3: exponential)
-        self.log_power = 1.0  # Power of logarithm (for log^k(n))
-        self.exp_base = 2.0  # Base of exponential (for k^n)
+        # Fields are set through object.__setattr__, as __setattr__ below rejects every assignment
+        _set = object.__setattr__
+        _set(self, 'a', a_val)  # Number of subproblems
+        _set(self, 'b', b_val)  # Division/decrease factor
+        _set(self, 'fn', fn_val)  # Non-recursive part f(n)
+        # Sets fn_type (0: constant, 1: logarithmic, 2: polynomial, 3: exponential, 4: log log n),
+        # log_power (p in log^p(n)), exp_base (base of k^n) and _k (k in n^k)
         self.determine_function_type()
     
+    def __setattr__(self, name, value):
+        # Relations are immutable once built: derived values (fn_type, log_b(a), the Master
+        # Theorem case) are computed up front and solutions are cached by the constructor arguments
+        raise AttributeError(f"{type(self).__name__} is immutable; build a new relation instead")
+    
     def determine_function_type(self):
-        # Handle constant functions
-        if self.fn in ["1", "c", "0"] or re.match(r"^\d+$", self.fn):
-            self.fn_type = 0
-        
-        # Handle combined polynomial and logarithmic (e.g., n*log(n))
-        elif "n" in self.fn and "log" in self.fn:
-            self.fn_type = 2  # Treat as polynomial for Master Theorem cases
-            
-            # Check for log power in n*log^p(n)
-            log_pos = self.fn.find("log")
-            if log_pos != -1:
-                power_pos = self.fn.find("^", log_pos)
-                if power_pos != -1:
-                    power_str = self.fn[power_pos + 1:]
-                    end_pos = power_str.find("(")
-                    if end_pos != -1:
-                        power_str = power_str[:end_pos]
-                    try:
-                        self.log_power = float(power_str)
-                    except:
-                        self.log_power = 1.0
-        
-        # Handle logarithmic functions (log^p(n))
-        elif "log" in self.fn:
-            self.fn_type = 1
-            # Check for log^2(n) or similar
-            if "^" in self.fn:
-                power_pos = self.fn.find("^")
-                if power_pos != -1 and power_pos > 0:
-                    # Extract the power value
-                    power_str = self.fn[power_pos + 1:]
-                    end_pos = power_str.find("(")
-                    if end_pos != -1:
-                        power_str = power_str[:end_pos]
-                    try:
-                        self.log_power = float(power_str)
-                    except:
-                        self.log_power = 1.0
-        
-        # Handle polynomial functions (n^k)
-        elif "n^" in self.fn or ("n" in self.fn and "^" not in self.fn):
-            self.fn_type = 2
-        
-        # Handle exponential functions (k^n)
-        elif "^n" in self.fn or "2^" in self.fn or "e^" in self.fn:
-            self.fn_type = 3
-            # Extract the base of the exponential
-            if "2^" in self.fn:
-                self.exp_base = 2.0
-            elif "e^" in self.fn:
-                self.exp_base = math.e
-            else:
-                base_pos = self.fn.find("^")
-                if base_pos != -1 and base_pos > 0:
-                    base_str = self.fn[:base_pos]
-                    try:
-                        self.exp_base = float(base_str)
-                    except:
-                        self.exp_base = 2.0
-        
-        else:
-            self.fn_type = 0  # Default to constant if no pattern is matched
+        key = self.fn.strip().lower()
+        fields = _FN_CACHE.get(key)
+        if fields is None:
+            fields = _parse_fn(key)
+        _set = object.__setattr__
+        _set(self, 'fn_type', fields[0])
+        _set(self, 'log_power', fields[1])
+        _set(self, 'exp_base', fields[2])
+        _set(self, '_k', fields[3])
     
     def get_polynomial_exponent(self):
-        if self.fn_type != 2:
-            return 0.0
-        
-        # For n*log^p(n) format
-        if "n" in self.fn and "log" in self.fn:
-            return 1.0  # The polynomial part is usually n^1
-        
-        pos = self.fn.find("^")
-        if pos != -1:
-            exp_str = self.fn[pos + 1:]
-            try:
-                return float(exp_str)
-            except:
-                return 1.0
-        
-        if "n" in self.fn:
-            return 1.0
-        
-        return 0.0
+        return self._k
     
     def solve(self, notation="Θ"):
+        # Same inputs always give the same solution, so reuse it across instances
+        key = (type(self), self._key(), notation)
+        solution = _SOLUTIONS.get(key)
+        if solution is None:
+            if len(_SOLUTIONS) >= _SOLUTIONS_MAX:
+                _SOLUTIONS.clear()
+            solution = _SOLUTIONS[key] = self._solve(notation)
+        return solution
+    
+    def compile_solver(self):
+        # Generates solve(notation) specialised for this relation: every number is
+        # formatted once here and baked into the function as string constants
+        parts = self._solve(_NOTATION_SLOT).split(_NOTATION_SLOT)
+        src = 'def _f(notation="Θ"):\n    return ' + " + notation + ".join(map(repr, parts)) + "\n"
+        namespace = {}
+        exec(compile(src, f"<solver for {self.get_recurrence_equation()}>", "exec"), namespace)
+        return namespace["_f"]
+    
+    def _key(self):
+        # Constructor arguments that fully determine the solution
+        return (self.a, self.b, self.fn)
+    
+    def _solve(self, notation):
         raise NotImplementedError("This method should be implemented by subclasses")
     
     def get_recurrence_equation(self):
@@ -107,10 +264,21 @@ class RecurrenceRelation:
 
 
 class DividingFunctionRecurrence(RecurrenceRelation):
+    __slots__ = ('diff_sizes', 'b_prime', '_log_a_b', '_master')
+    
     def __init__(self, a_val, b_val, fn_val, diff_sizes=False, b_prime_val=0):
+        # log_b(a) and the Master Theorem only make sense for a > 0 and subproblems that shrink
+        if a_val <= 0 or b_val <= 1 or (diff_sizes and b_prime_val <= 1):
+            raise ValueError(f"Dividing recurrence needs a > 0 and b > 1, got a={a_val}, b={b_val}"
+                             + (f", b'={b_prime_val}" if diff_sizes else ""))
         super().__init__(a_val, b_val, fn_val)
-        self.diff_sizes = diff_sizes  # Whether subproblems have different sizes
-        self.b_prime = b_prime_val  # Second division factor (if differentSizes is true)
+        _set = object.__setattr__
+        _set(self, 'diff_sizes', diff_sizes)  # Whether subproblems have different sizes
+        _set(self, 'b_prime', b_prime_val)  # Second division factor (if differentSizes is true)
+        _set(self, '_log_a_b', critical_exponent(a_val, b_val))  # Critical exponent log_b(a)
+        if not diff_sizes:
+            # Master Theorem (case id, bound exponent, log exponent); unset for the approximation method
+            _set(self, '_master', classify(a_val, b_val, self._k, self.log_power))
     
     def get_recurrence_equation(self):
         if self.diff_sizes:
@@ -121,84 +289,37 @@ class DividingFunctionRecurrence(RecurrenceRelation):
     def get_method_name(self):
         if self.diff_sizes:
             return "Approximation Method"
-        else:
-            log_a_b = math.log(self.a) / math.log(self.b)
-            k = self.get_polynomial_exponent()
-            b_power_k = self.b ** k
-            
-            # Use the exact Master Theorem case
-            if abs(self.a - b_power_k) < 0.0001:
-                if self.log_power > -1:
-                    return "Master Theorem (Case 2a)"
-                elif abs(self.log_power - (-1)) < 0.0001:
-                    return "Master Theorem (Case 2b)"
-                else:
-                    return "Master Theorem (Case 2c)"
-            elif self.a > b_power_k:
-                return "Master Theorem (Case 1)"
-            elif self.a < b_power_k:
-                if self.log_power >= 0:
-                    return "Master Theorem (Case 3a)"
-                else:
-                    return "Master Theorem (Case 3b)"
-            elif self.fn_type == 3:
-                return "Extended Master Theorem"
-            
-            return "Advanced Master Theorem"
+        return _MASTER_CASES[self._master[0]][0]
     
     def apply_master_theorem(self, notation):
-        log_a_b = math.log(self.a) / math.log(self.b)
-        k = self.get_polynomial_exponent()  # This is k in n^k
-        p = self.log_power  # This is p in log^p(n)
-        b_power_k = self.b ** k
-        
-        # Case 1: a > b^k
-        if self.a > b_power_k:
-            return f"{notation}(n^{log_a_b:.2f})"
-        # Case 2: a = b^k
-        elif abs(self.a - b_power_k) < 0.0001:
-            if p > -1:
-                # Case 2(a): p > -1
-                return f"{notation}(n^{log_a_b:.2f} * log^{p+1:.2f}n)"
-            elif abs(p - (-1)) < 0.0001:
-                # Case 2(b): p = -1
-                return f"{notation}(n^{log_a_b:.2f} * log log n)"
-            else:
-                # Case 2(c): p < -1
-                return f"{notation}(n^{log_a_b:.2f})"
-        # Case 3: a < b^k
-        else:
-            if p >= 0:
-                # Case 3(a): p >= 0
-                return f"{notation}(n^{k:.2f} * log^{p:.2f}n)"
-            else:
-                # Case 3(b): p < 0
-                return f"{notation}(n^{k:.2f})"
+        case, exp, log_exp = self._master
+        return _MASTER_CASES[case][1](notation, exp, log_exp)
     
     def apply_extended_master_theorem(self, notation):
-        log_a_b = math.log(self.a) / math.log(self.b)
+        log_a_b = self._log_a_b
         
         if self.fn_type == 3:
             if self.exp_base > 1.0:
                 return f"{notation}({self.exp_base:.2f}^n)"
         
-        if self.fn_type == 1:
-            if self.log_power > 1.0:
-                return f"{notation}(n^{log_a_b:.2f} * log^{self.log_power:.2f} n)"
-            return f"{notation}(n^{log_a_b:.2f} * log log n)"
+        if self.fn_type == 4:
+            # f(n) = log log n grows slower than any n^k with k > 0
+            d = self.a - 1
+            if abs(d) < 0.0001:
+                return f"{notation}(log n * log log n)"
+            elif d > 0:
+                return f"{notation}(n^{log_a_b:.2f})"
+            return f"{notation}(log log n)"
         
         return self.apply_master_theorem(notation)
     
     def apply_approximation_method(self, notation):
-        avg = (1.0/self.b + 1.0/self.b_prime) / 2.0
-        eff_b = 1.0 / avg
-        eff_a = 2.0
-        log_a_b = math.log(eff_a) / math.log(eff_b)
+        log_a_b = approximation_exponent(self.b, self.b_prime)
         
         if self.fn_type == 0:
             return f"{notation}(n^{log_a_b:.2f})"
         elif self.fn_type == 2:
-            exp = self.get_polynomial_exponent()
+            exp = self._k
             
             if exp < log_a_b:
                 return f"{notation}(n^{log_a_b:.2f})"
@@ -215,17 +336,22 @@ class DividingFunctionRecurrence(RecurrenceRelation):
         
         return f"{notation}(n^{log_a_b:.2f})"
     
-    def solve(self, notation="Θ"):
+    def _key(self):
+        return (self.a, self.b, self.fn, self.diff_sizes, self.b_prime)
+    
+    def _solve(self, notation):
         if self.diff_sizes:
             return self.apply_approximation_method(notation)
         else:
-            if self.fn_type == 3 or "log log" in self.fn:
+            if self.fn_type == 3 or self.fn_type == 4:
                 return self.apply_extended_master_theorem(notation)
             else:
                 return self.apply_master_theorem(notation)
 
 
 class DecreasingFunctionRecurrence(RecurrenceRelation):
+    __slots__ = ()
+    
     def __init__(self, a_val, b_val, fn_val):
         super().__init__(a_val, b_val, fn_val)
     
@@ -245,7 +371,7 @@ class DecreasingFunctionRecurrence(RecurrenceRelation):
         if self.fn_type == 0:
             return f"{notation}(n)"
         elif self.fn_type == 2:
-            exp = self.get_polynomial_exponent()
+            exp = self._k
             return f"{notation}(n^{exp+1:.2f})"
         elif self.fn_type == 1:
             if self.log_power > 1.0:
@@ -253,6 +379,8 @@ class DecreasingFunctionRecurrence(RecurrenceRelation):
             return f"{notation}(n log n)"
         elif self.fn_type == 3:
             return f"{notation}(n * {self.exp_base:.2f}^n)"
+        elif self.fn_type == 4:
+            return f"{notation}(n log log n)"
         
         return f"{notation}(n * {self.fn})"
     
@@ -271,7 +399,7 @@ class DecreasingFunctionRecurrence(RecurrenceRelation):
                 return f"{notation}({self.a:.2f}^(n/{self.b:.2f}))"
             
             elif self.fn_type == 2:  # Polynomial function
-                exp = self.get_polynomial_exponent()
+                exp = self._k
                 # Special case for n^k where a > 1
                 # T(n) = aT(n-b) + n^k => T(n) = Θ(n^k * a^(n/b))
                 return f"{notation}(n^{exp:.2f} * {self.a:.2f}^(n/{self.b:.2f}))"
@@ -284,13 +412,13 @@ class DecreasingFunctionRecurrence(RecurrenceRelation):
             
             elif self.fn_type == 3:  # Exponential function
                 # T(n) = aT(n-b) + k^n => T(n) = Θ((max(a, k^b))^(n/b))
-                max_val = max(self.a, self.exp_base ** self.b)
+                max_val = substitution_base(self.a, self.b, self.fn_type, self.exp_base)
                 return f"{notation}({max_val:.2f}^(n/{self.b:.2f}))"
         
         # Default for unexpected cases
         return f"{notation}({self.a:.2f}^(n/{self.b:.2f}))"
     
-    def solve(self, notation="Θ"):
+    def _solve(self, notation):
         if self.a == 1:
             return self.apply_muster_theorem(notation)
         else:
@@ -321,53 +449,32 @@ class RecurrenceSolver:
     
     def parse_equation(self, equation):
         # Remove all whitespace
-        equation = re.sub(r'\s+', '', equation)
+        match = _EQ_RE.match(_WS_RE.sub('', equation).lower())
+        if not match:
+            raise ValueError(f"Unrecognised recurrence: {equation.strip()}")
+        
+        coeff, b_div, b_dec, b_first, b_prime, fn = match.groups()
+        self.fn = fn
         
-        # Check if it's a dividing function
-        if "t(n/" in equation.lower() or "t(n/" in equation.lower():
+        # Different sizes, e.g. T(n/b) + T(n/b')
+        if b_first is not None:
             self.type = 1
-            # Check for different sizes
-            if equation.lower().count("t(n/") == 2:
-                self.diff_sizes = True
-                # Extract both division factors
-                parts = re.split(r'[+-]', equation.lower().split('+')[-1])
-                self.fn = parts[-1]
-                
-                # Find all n/b patterns
-                matches = re.findall(r't\(n/([^)]+)\)', equation.lower())
-                if len(matches) >= 2:
-                    self.b = float(matches[0])
-                    self.b_prime = float(matches[1])
-                self.a = 2  # For different size problems
-            else:
-                # Standard dividing function
-                match = re.match(r't\(n\)=(\d+)t\(n/([^)]+)\)\+([^+]+)', equation.lower())
-                if match:
-                    self.a = float(match.group(1))
-                    self.b = float(match.group(2))
-                    self.fn = match.group(3)
-                else:
-                    # Handle case where coefficient might be omitted (assume 1)
-                    match = re.match(r't\(n\)=t\(n/([^)]+)\)\+([^+]+)', equation.lower())
-                    if match:
-                        self.a = 1
-                        self.b = float(match.group(1))
-                        self.fn = match.group(2)
+            self.diff_sizes = True
+            self.b = float(b_first)
+            self.b_prime = float(b_prime)
+            self.a = 2  # For different size problems
+            return
+        
+        if b_div is not None:
+            self.type = 1
+            self.b = float(b_div)
         else:
-            # Assume decreasing function
+            # Decreasing function
             self.type = 2
-            match = re.match(r't\(n\)=(\d+)t\(n-([^)]+)\)\+([^+]+)', equation.lower())
-            if match:
-                self.a = float(match.group(1))
-                self.b = float(match.group(2))
-                self.fn = match.group(3)
-            else:
-                # Handle case where coefficient might be omitted (assume 1)
-                match = re.match(r't\(n\)=t\(n-([^)]+)\)\+([^+]+)', equation.lower())
-                if match:
-                    self.a = 1
-                    self.b = float(match.group(1))
-                    self.fn = match.group(2)
+            self.b = float(b_dec)
+        
+        # Coefficient might be omitted (assume 1)
+        self.a = float(coeff) if coeff else 1
     
     def get_input(self):
         equation = input("\nEnter your recurrence relation (e.g., T(n)=2T(n/2)+n): ")
@@ -378,25 +485,22 @@ class RecurrenceSolver:
         print("2. Big Ω (Lower bound)")
         print("3. Big Θ (Tight bound)")
         
-        while True:
-            choice = input("Enter choice (1-3): ")
-            if choice == '1':
-                self.notation = "O"
-                break
-            elif choice == '2':
-                self.notation = "Ω"
-                break
-            elif choice == '3':
-                self.notation = "Θ"
-                break
-            else:
-                print("Invalid choice. Please enter 1, 2, or 3.")
+        while (notation := _NOTATION_CHOICES.get(input("Enter choice (1-3): "))) is None:
+            print("Invalid choice. Please enter 1, 2, or 3.")
+        self.notation = notation
     
     def create_relation(self):
-        if self.type == 1:
-            return DividingFunctionRecurrence(self.a, self.b, self.fn, self.diff_sizes, self.b_prime)
-        else:
-            return DecreasingFunctionRecurrence(self.a, self.b, self.fn)
+        key = (self.type, self.a, self.b, self.fn, self.diff_sizes, self.b_prime)
+        relation = _RELATIONS.get(key)
+        if relation is None:
+            if self.type == 1:
+                relation = DividingFunctionRecurrence(self.a, self.b, self.fn, self.diff_sizes, self.b_prime)
+            else:
+                relation = DecreasingFunctionRecurrence(self.a, self.b, self.fn)
+            if len(_RELATIONS) >= _RELATIONS_MAX:
+                _RELATIONS.clear()
+            _RELATIONS[key] = relation
+        return relation
     
     def show_result(self, relation):
         print("\n==================================================")
@@ -408,9 +512,12 @@ class RecurrenceSolver:
     
     def run(self):
         self.display_intro()
-        self.get_input()
-        
-        relation = self.create_relation()
+        try:
+            self.get_input()
+            relation = self.create_relation()
+        except ValueError as e:
+            print(f"\nError: {e}")
+            return
         self.show_result(relation)
 
 
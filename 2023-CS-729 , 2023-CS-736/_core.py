@@ -0,0 +1,58 @@
+import math
+
+# Numeric core of the recurrence solver: plain floats and ints in, plain numbers out.
+# Kept free of strings and objects so it can be compiled ahead of time with
+#     mypyc _core.py
+# which leaves a native _core extension next to this file that is imported instead.
+# The string formatting around these results stays in Daa cpp.py.
+
+
+def critical_exponent(a: float, b: float) -> float:
+    # log_b(a); raises ValueError when the logarithm does not exist.
+    # Common bases use their own libm call, so no log(b) is computed or divided by
+    if a <= 0 or b <= 0 or b == 1:
+        raise ValueError("log_b(a) needs a > 0, b > 0 and b != 1")
+    if b == 2:
+        return math.log2(a)  # Binary splits are the common case
+    elif b == 10:
+        return math.log10(a)
+    elif b == math.e:
+        return math.log(a)
+    return math.log(a) / math.log(b)
+
+
+def classify(a: float, b: float, k: float, p: float) -> tuple[int, float, float]:
+    # Master Theorem for T(n) = aT(n/b) + n^k * log^p(n).
+    # Returns (case id into _MASTER_CASES, bound exponent, log exponent)
+    log_a_b = critical_exponent(a, b)
+    d = a - b ** k
+    
+    # Case 2: a = b^k
+    if abs(d) < 0.0001:
+        if p > -1:
+            return 1, log_a_b, p + 1.0
+        elif abs(p - (-1)) < 0.0001:
+            return 2, log_a_b, 0.0
+        return 3, log_a_b, 0.0
+    # Case 1: a > b^k
+    elif d > 0:
+        return 0, log_a_b, 0.0
+    # Case 3: a < b^k
+    elif p >= 0:
+        return 4, float(k), float(p)
+    return 5, float(k), 0.0
+
+
+def approximation_exponent(b: float, b_prime: float) -> float:
+    # Exponent log_b(2) for T(n) = T(n/b) + T(n/b') + f(n), using the average split as b.
+    avg = (1.0/b + 1.0/b_prime) / 2.0
+    eff_b = 1.0 / avg
+    eff_a = 2.0
+    return critical_exponent(eff_a, eff_b)
+
+
+def substitution_base(a: float, b: float, fn_type: int, exp_base: float) -> float:
+    # Base c of the c^(n/b) growth of T(n) = aT(n-b) + f(n) for a > 1
+    if fn_type == 3:
+        return max(float(a), exp_base ** b)
+    return float(a)
@@ -0,0 +1,169 @@
+import importlib.util
+import math
+import os
+import unittest
+
+# "Daa cpp.py" is not an importable module name, so it is loaded from its path
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_spec = importlib.util.spec_from_file_location("daa_cpp", os.path.join(_HERE, "Daa cpp.py"))
+solver = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(solver)
+
+
+class ParseFnTest(unittest.TestCase):
+    # f(n) -> (fn_type, log_power, exp_base, poly_exp)
+    FIELDS = {
+        "1": (0, 1.0, 2.0, 0.0),
+        "c": (0, 1.0, 2.0, 0.0),
+        "5": (0, 1.0, 2.0, 0.0),
+        "x": (0, 1.0, 2.0, 0.0),
+        "log(n)": (1, 1.0, 2.0, 0.0),
+        "logn": (1, 1.0, 2.0, 0.0),
+        "log n": (1, 1.0, 2.0, 0.0),
+        "log^2(n)": (1, 2.0, 2.0, 0.0),
+        "log(n)^3": (1, 3.0, 2.0, 0.0),
+        "log^-1(n)": (1, -1.0, 2.0, 0.0),
+        "loglog(n)": (4, 1.0, 2.0, 0.0),
+        "log log n": (4, 1.0, 2.0, 0.0),
+        "log(log(n))": (4, 1.0, 2.0, 0.0),
+        "n": (2, 1.0, 2.0, 1.0),
+        "n^2": (2, 1.0, 2.0, 2.0),
+        "n^0.5": (2, 1.0, 2.0, 0.5),
+        "3n^2": (2, 1.0, 2.0, 2.0),
+        "sqrt(n)": (2, 1.0, 2.0, 1.0),
+        "n*log(n)": (2, 1.0, 2.0, 1.0),
+        "nlog(n)": (2, 1.0, 2.0, 1.0),
+        "log(n)*n": (2, 1.0, 2.0, 1.0),
+        "n*log^2(n)": (2, 2.0, 2.0, 1.0),
+        "2^n": (3, 1.0, 2.0, 0.0),
+        "e^n": (3, 1.0, math.e, 0.0),
+        "1.5^n": (3, 1.0, 1.5, 0.0),
+        "32^n": (3, 1.0, 32.0, 0.0),
+        "2^(n/2)": (3, 1.0, 2.0, 0.0),
+        "n*2^n": (3, 1.0, 2.0, 0.0),
+    }
+    
+    def test_fields(self):
+        for fn, expected in self.FIELDS.items():
+            with self.subTest(fn=fn):
+                self.assertEqual(solver._parse_fn(fn), expected)
+    
+    def test_loglog_solutions(self):
+        cases = {
+            "T(n)=T(n/2)+loglog(n)": "Θ(log n * log log n)",
+            "T(n)=4T(n/2)+loglog(n)": "Θ(n^2.00)",
+            "T(n)=T(n-1)+loglog(n)": "Θ(n log log n)",
+        }
+        for equation, expected in cases.items():
+            parser = solver.RecurrenceSolver()
+            parser.parse_equation(equation)
+            with self.subTest(equation=equation):
+                self.assertEqual(parser.create_relation().solve(), expected)
+
+
+class ParseEquationTest(unittest.TestCase):
+    # equation -> (type, a, b, fn, diff_sizes, b_prime)
+    ACCEPTED = {
+        "T(n)=2T(n/2)+n": (1, 2.0, 2.0, "n", False, 0),
+        "T(n) = 8T(n/2) + n^2": (1, 8.0, 2.0, "n^2", False, 0),
+        "T(n)=T(n/2)+1": (1, 1, 2.0, "1", False, 0),
+        "T(n)=2T(n/2)+sqrt(n)": (1, 2.0, 2.0, "sqrt(n)", False, 0),
+        "T(n)=T(n/3)+T(n/1.5)+n": (1, 2, 3.0, "n", True, 1.5),
+        "T(n)=2T(n-1)+n": (2, 2.0, 1.0, "n", False, 0),
+        "T(n)=T(n-1)+log(n)": (2, 1, 1.0, "log(n)", False, 0),
+    }
+    REJECTED = [
+        "garbage",
+        "T(n)=2T(n/2)",
+        "T(n)=2T(n/x)+n",
+        "T(n)=2T(n/-2)+n",
+        "T(n)=T(n/2)-T(n/3)+n",
+        "T(n)=2T(n/2)+n+T(n/3)",
+        "T(n)=2T(n/2)+T(n/3)+n",
+        "T(n)=T(n/2)+2T(n/3)+n",
+        "T(n)=T(n/2)+T(n-1)+n",
+        "T(n)=T(n/2)+T(n/3)+T(n/4)+n",
+    ]
+    
+    def test_accepted(self):
+        for equation, expected in self.ACCEPTED.items():
+            parser = solver.RecurrenceSolver()
+            parser.parse_equation(equation)
+            with self.subTest(equation=equation):
+                self.assertEqual((parser.type, parser.a, parser.b, parser.fn, parser.diff_sizes, parser.b_prime),
+                                 expected)
+    
+    def test_rejected(self):
+        for equation in self.REJECTED:
+            with self.subTest(equation=equation), self.assertRaises(ValueError):
+                solver.RecurrenceSolver().parse_equation(equation)
+
+
+@unittest.skipIf(solver.np is None, "solve_many requires numpy")
+class SolveManyTest(unittest.TestCase):
+    def test_matches_classify(self):
+        rows = [(a, b, k, p)
+                for a in (0.5, 1, 2, 3, 4, 8, 9, 16)
+                for b in (1.5, 2, 3, 4, 10, math.e)
+                for k in (0, 0.5, 1, 2, 3)
+                for p in (-2, -1, 0, 1, 2)]
+        case, exponent, log_exp = solver.solve_many(*zip(*rows))
+        for i, row in enumerate(rows):
+            with self.subTest(row=row):
+                self.assertEqual((case[i], exponent[i], log_exp[i]), solver.classify(*row))
+    
+    def test_invalid_rows(self):
+        a = [2, 0, -1, 2, 2]
+        b = [2, 2, 2, 1, -2]
+        case, exponent, log_exp = solver.solve_many(a, b, [1] * 5, [0] * 5)
+        self.assertEqual(case.tolist(), [1, -1, -1, -1, -1])
+        self.assertTrue(all(math.isnan(x) for x in exponent[1:]))
+        self.assertTrue(all(math.isnan(x) for x in log_exp[1:]))
+
+
+class JitKernelsTest(unittest.TestCase):
+    def test_matches_core(self):
+        kernels = solver.jit_kernels()
+        for a in (0.5, 1, 2, 3, 4, 8):
+            for b in (1.5, 2, 3, 4, 10):
+                with self.subTest(a=a, b=b):
+                    self.assertEqual(kernels["critical_exponent"](a, b), solver.critical_exponent(a, b))
+                    self.assertEqual(kernels["approximation_exponent"](a + 1, b),
+                                     solver.approximation_exponent(a + 1, b))
+                    for fn_type in (0, 3):
+                        self.assertEqual(kernels["substitution_base"](a, b, fn_type, 2.0),
+                                         solver.substitution_base(a, b, fn_type, 2.0))
+                    for k in (0.0, 1.0, 2.0):
+                        for p in (-2.0, -1.0, 0.0, 1.0):
+                            self.assertEqual(tuple(kernels["classify"](a, b, k, p)), solver.classify(a, b, k, p))
+    
+    def test_undefined_log(self):
+        with self.assertRaises(ValueError):
+            solver.jit_kernels()["critical_exponent"](2.0, 1.0)
+
+
+class CompileSolverTest(unittest.TestCase):
+    RELATIONS = [
+        (solver.DividingFunctionRecurrence, (8, 2, "n^2")),
+        (solver.DividingFunctionRecurrence, (2, 2, "n")),
+        (solver.DividingFunctionRecurrence, (2, 2, "n*log^-1(n)")),
+        (solver.DividingFunctionRecurrence, (1, 2, "n^2*log(n)")),
+        (solver.DividingFunctionRecurrence, (2, 2, "2^n")),
+        (solver.DividingFunctionRecurrence, (1, 3, "n", True, 1.5)),
+        (solver.DecreasingFunctionRecurrence, (1, 1, "log(n)")),
+        (solver.DecreasingFunctionRecurrence, (2, 1, "n")),
+        (solver.DecreasingFunctionRecurrence, (0.5, 1, "1")),
+    ]
+    
+    def test_matches_solve(self):
+        for cls, args in self.RELATIONS:
+            relation = cls(*args)
+            compiled = relation.compile_solver()
+            with self.subTest(relation=relation.get_recurrence_equation()):
+                self.assertEqual(compiled(), relation.solve())
+                for notation in solver._NOTATION_CHOICES.values():
+                    self.assertEqual(compiled(notation), relation.solve(notation))
+
+
+if __name__ == "__main__":
+    unittest.main()